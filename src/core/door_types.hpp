@@ -39,6 +39,16 @@ struct DoorConfig
     } lock;
 };
 
+// Decoded Wiegand card read, handed to the door directly without a
+// JSON serialize/parse round trip
+struct CardRead
+{
+    std::string rawHex;
+    uint16_t facilityCode;
+    uint32_t cardNumber;
+    bool parityValid;
+};
+
 class DoorState
 {
 public:
@@ -1,5 +1,9 @@
 #pragma once
 #include <memory>
+#include <thread>
+#include <mutex>
+#include <condition_variable>
+#include <chrono>
 #include <spdlog/spdlog.h>
 #include "../core/door_types.hpp"
 #include "../utils/logger.hpp"
@@ -42,30 +46,41 @@ public:
     Door(const DoorConfig& config, std::shared_ptr<MqttClient> mqtt)
         : config_(config)
         , mqtt_(mqtt)
+        , statusTopic_("door/" + config.doorId + "/status")
+        , commandTopic_("door/" + config.doorId + "/command")
     {
+        // One chip handle shared by every component on this door instead
+        // of each component opening /dev/gpiochip0 itself
+        gpioChip_ = std::make_shared<gpiod::chip>("/dev/gpiochip0");
+
         // Initialize components
-        reader_ = std::make_unique<WiegandReader>(config.doorId, 
+        reader_ = std::make_unique<WiegandReader>(config.doorId,
                                                 config.reader.data0Pin,
-                                                config.reader.data1Pin);
-        
+                                                config.reader.data1Pin,
+                                                gpioChip_);
+
         doorSensor_ = std::make_unique<GpioSensor>(config.doorId,
                                                   config.doorSensor.pin,
                                                   config.doorSensor.activeHigh,
-                                                  "door_sensor");
-        
+                                                  "door_sensor",
+                                                  gpioChip_);
+
         proximitySensor_ = std::make_unique<GpioSensor>(config.doorId,
                                                        config.proximitySensor.pin,
                                                        config.proximitySensor.activeHigh,
-                                                       "proximity");
-        
+                                                       "proximity",
+                                                       gpioChip_);
+
         exitButton_ = std::make_unique<GpioSensor>(config.doorId,
                                                   config.exitButton.pin,
                                                   config.exitButton.activeHigh,
-                                                  "exit_button");
-        
+                                                  "exit_button",
+                                                  gpioChip_);
+
         lock_ = std::make_unique<DoorLock>(config.doorId,
                                             config.lock.setPin,
-                                            config.lock.unsetPin);
+                                            config.lock.unsetPin,
+                                            gpioChip_);
 
         Logger::initialize(config.doorId);
         logger_ = Logger::getDoorLogger(config.doorId);
@@ -117,6 +132,10 @@ public:
             }
         }
 
+        // Persistent worker that re-locks the door after temporary unlocks,
+        // instead of spawning a thread per unlock
+        relockThread_ = std::thread(&Door::relockLoop, this);
+
         setupEventHandlers();
         logger_->info("Door {} initialized with card reader", config_.doorId);
         return true;
@@ -124,6 +143,16 @@ public:
 
     void cleanup()
     {
+        {
+            std::lock_guard<std::mutex> guard(relockMutex_);
+            relockStop_ = true;
+        }
+        relockCv_.notify_one();
+        if (relockThread_.joinable())
+        {
+            relockThread_.join();
+        }
+
         if (reader_) reader_->cleanup();
         if (doorSensor_) doorSensor_->cleanup();
         if (proximitySensor_) proximitySensor_->cleanup();
@@ -134,10 +163,14 @@ public:
 private:
     void setupEventHandlers()
     {
-        // Card reader events
+        // Card reader events: access decision via the typed handler,
+        // serialized event only for MQTT/logging
+        reader_->registerCardHandler([this](const CardRead& card)
+        {
+            handleCardRead(card);
+        });
         reader_->registerCallback([this](const std::string& topic, const std::string& message)
         {
-            handleCardRead(message);
             mqtt_->publish(topic, message);
             logger_->info("Card read event on door {}: {}", config_.doorId, message);
         });
@@ -172,68 +205,35 @@ private:
 
     void setupMqttHandlers()
     {
-        mqtt_->subscribe("door/" + config_.doorId + "/command");
-        mqtt_->setMessageHandler([this](const std::string& topic, const std::string& payload)
-        {
-            handleMqttCommand(payload);
-        });
+        mqtt_->subscribe(commandTopic_,
+            [this](const std::string& topic, const std::string& payload)
+            {
+                handleMqttCommand(payload);
+            });
     }
 
-    void handleCardRead(const std::string& message)
+    void handleCardRead(const CardRead& card)
     {
-        try
+        logger_->debug("Received card read event. Card Raw Hex: {}", card.rawHex);
+        // Single probe of the whitelist on the hot decision path
+        auto cardIt = ALLOWED_HEX_CARDS.find(card.rawHex);
+        if (cardIt != ALLOWED_HEX_CARDS.end())
         {
-            nlohmann::json event = nlohmann::json::parse(message);
-            if (event.contains("card") && event["card"].contains("raw"))
+            auto nameIt = CARD_USER_NAMES.find(card.rawHex);
+            if (nameIt != CARD_USER_NAMES.end())
             {
-                std::string rawHexValue = event["card"]["raw"].get<std::string>();
-                logger_->info("Received card read event. Card Raw Hex: {}", rawHexValue);
-                if (ALLOWED_HEX_CARDS.count(rawHexValue) > 0)
-                {
-                    auto cardIt = ALLOWED_HEX_CARDS.find(rawHexValue);
-                    if (cardIt != ALLOWED_HEX_CARDS.end())
-                    {
-                        auto nameIt = CARD_USER_NAMES.find(rawHexValue);
-                        if (nameIt != CARD_USER_NAMES.end())
-                        {
-                            logger_->info("Access GRANTED (Card found in whitelist) to user: {}).", nameIt->second);
-                            spdlog::info("Access GRANTED (Card found in whitelist) to user: {}).", nameIt->second);
-                        }
-                        else
-                        {
-                            logger_->info("Access GRANTED (Card found in whitelist).");
-                            spdlog::info("Access GRANTED (Card found in whitelist).");
-                        }
-
-                        unlockTemporarily();
-                    }
-                }
-                else
-                {
-                    logger_->info("Access DENIED (Card NOT in whitelist).");
-                    spdlog::info("Access DENIED (Card NOT in whitelist).");
-                }
+                logger_->info("Access GRANTED (Card found in whitelist) to user: {}.", nameIt->second);
             }
             else
             {
-                logger_->error("Error: JSON message missing 'card' or 'raw' fields.");
-                spdlog::error("Error: JSON message missing 'card' or 'raw' fields.");
+                logger_->info("Access GRANTED (Card found in whitelist).");
             }
+
+            unlockTemporarily();
         }
-        catch (const nlohmann::json::parse_error& e)
-        {
-            logger_->error("JSON Parse Error: {} on message: {}", e.what(), message);
-            spdlog::error("JSON Parse Error: {} on message: {}", e.what(), message);
-        }
-        catch (const nlohmann::json::exception& e)
-        {
-            logger_->error("JSON Access Error: {}", e.what());
-            spdlog::error("JSON Access Error: {}", e.what());
-        }
-        catch (const std::exception& e)
+        else
         {
-            logger_->error("Standard Exception: {}", e.what());
-            spdlog::error("Standard Exception: {}", e.what());
+            logger_->info("Access DENIED (Card NOT in whitelist).");
         }
     }
 
@@ -258,15 +258,22 @@ private:
         try
         {
             auto cmd = nlohmann::json::parse(payload);
-            if (cmd["action"] == "unlock")
+            // Look up "action" once instead of re-hashing it per comparison
+            auto actionIt = cmd.find("action");
+            if (actionIt == cmd.end())
+            {
+                return;
+            }
+            const auto& action = *actionIt;
+            if (action == "unlock")
             {
                 unlockTemporarily();
             }
-            else if (cmd["action"] == "lock")
+            else if (action == "lock")
             {
                 lock_->setState(true);
             }
-            else if (cmd["action"] == "status")
+            else if (action == "status")
             {
                 publishStatus();
             }
@@ -283,30 +290,73 @@ private:
         state_.isLocked = false;
         publishStatus();
 
-        // Start a thread to re-lock after delay
-        std::thread([this]()
+        // Arm (or extend) the relock deadline; the persistent worker
+        // re-locks once it expires
+        {
+            std::lock_guard<std::mutex> guard(relockMutex_);
+            relockDeadline_ = std::chrono::steady_clock::now() + std::chrono::seconds(5);
+            relockPending_ = true;
+        }
+        relockCv_.notify_one();
+    }
+
+    void relockLoop()
+    {
+        std::unique_lock<std::mutex> guard(relockMutex_);
+        while (!relockStop_)
         {
-            std::this_thread::sleep_for(std::chrono::seconds(5));
+            if (!relockPending_)
+            {
+                relockCv_.wait(guard);
+                continue;
+            }
+
+            // Wake either at the deadline or when a new unlock extends it
+            relockCv_.wait_until(guard, relockDeadline_);
+            if (relockStop_)
+            {
+                break;
+            }
+            if (std::chrono::steady_clock::now() < relockDeadline_)
+            {
+                continue;
+            }
+
+            relockPending_ = false;
+            guard.unlock();
             lock_->setState(true);
             state_.isLocked = true;
             publishStatus();
-        }).detach();
+            guard.lock();
+        }
     }
 
     void publishStatus()
     {
         nlohmann::json status = state_.toJson();
-        mqtt_->publish("door/" + config_.doorId + "/status", status.dump());
+        mqtt_->publish(statusTopic_, status.dump());
     }
 
     DoorConfig config_;
     DoorState state_;
+    std::string statusTopic_;
+    std::string commandTopic_;
     std::shared_ptr<spdlog::logger> logger_;
     std::shared_ptr<MqttClient> mqtt_;
 
+    // Declared before the components so it outlives their lines
+    std::shared_ptr<gpiod::chip> gpioChip_;
+
     std::unique_ptr<WiegandReader> reader_;
     std::unique_ptr<GpioSensor> doorSensor_;
     std::unique_ptr<GpioSensor> proximitySensor_;
     std::unique_ptr<GpioSensor> exitButton_;
     std::unique_ptr<DoorLock> lock_;
+
+    std::thread relockThread_;
+    std::mutex relockMutex_;
+    std::condition_variable relockCv_;
+    std::chrono::steady_clock::time_point relockDeadline_;
+    bool relockPending_{false};
+    bool relockStop_{false};
 };
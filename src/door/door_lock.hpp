@@ -2,16 +2,21 @@
 #include <gpiod.hpp>
 #include <thread>
 #include <chrono>
+#include <mutex>
+#include <condition_variable>
+#include <queue>
 #include <spdlog/spdlog.h>
 #include "../core/interfaces.hpp"
 
 class DoorLock : public IDoorComponent, public IControllable
 {
 public:
-    DoorLock(const std::string& doorId, unsigned int setPin, unsigned int unsetPin)
+    DoorLock(const std::string& doorId, unsigned int setPin, unsigned int unsetPin,
+             std::shared_ptr<gpiod::chip> chip)
         : doorId_(doorId)
         , setPin_(setPin)
         , unsetPin_(unsetPin)
+        , chip_(std::move(chip))
     {
         // Set pin connects COM to NC
         // Unset pin connects COM to NO
@@ -21,7 +26,6 @@ public:
     {
         try
         {
-            chip_ = std::make_unique<gpiod::chip>("/dev/gpiochip0");
             setLine_ = chip_->get_line(setPin_);
             unsetLine_ = chip_->get_line(unsetPin_);
             
@@ -32,7 +36,12 @@ public:
             // Initialize both lines to low
             setLine_.set_value(0);
             unsetLine_.set_value(0);
-            
+
+            // Worker thread performs the relay pulses so callers never
+            // block for the pulse duration
+            running_ = true;
+            workerThread_ = std::thread(&DoorLock::workerLoop, this);
+
             // Start in locked state
             setState(true);
             return true;
@@ -46,9 +55,66 @@ public:
     void cleanup() override
     {
         setState(true); // Lock on cleanup
+        {
+            std::lock_guard<std::mutex> guard(queueMutex_);
+            running_ = false;
+        }
+        queueCv_.notify_one();
+        if (workerThread_.joinable())
+        {
+            workerThread_.join();
+        }
     }
 
     bool setState(bool locked) override
+    {
+        // Queue the command for the worker thread; the 50ms relay pulse
+        // would otherwise stall the calling event thread
+        {
+            std::lock_guard<std::mutex> guard(queueMutex_);
+            if (!running_)
+            {
+                return false;
+            }
+            commands_.push(locked);
+        }
+        queueCv_.notify_one();
+        return true;
+    }
+
+    bool getState() const override
+    {
+        return currentState_.load();
+    }
+
+private:
+    void workerLoop()
+    {
+        std::unique_lock<std::mutex> guard(queueMutex_);
+        // Keep draining after shutdown so the final lock command from
+        // cleanup() is always applied
+        while (running_ || !commands_.empty())
+        {
+            if (commands_.empty())
+            {
+                queueCv_.wait(guard);
+                continue;
+            }
+            // Only the latest commanded state matters for a latching
+            // relay: coalesce everything queued and skip the 50ms pulse
+            // when the relay is already in that state
+            bool locked = commands_.back();
+            commands_ = {};
+            guard.unlock();
+            if (!statePulsed_ || locked != currentState_.load())
+            {
+                applyState(locked);
+            }
+            guard.lock();
+        }
+    }
+
+    void applyState(bool locked)
     {
         try
         {
@@ -69,25 +135,27 @@ public:
                 unsetLine_.set_value(0);
             }
             currentState_ = locked;
-            return true;
+            statePulsed_ = true;
         }
         catch (const std::exception& e)
         {
-            return false;
+            spdlog::error("Lock actuation failed on door {}: {}", doorId_, e.what());
         }
     }
 
-    bool getState() const override
-    {
-        return currentState_.load();
-    }
-
-private:
     std::string doorId_;
     unsigned int setPin_;
     unsigned int unsetPin_;
-    std::unique_ptr<gpiod::chip> chip_;
+    std::shared_ptr<gpiod::chip> chip_;
     gpiod::line setLine_;
     gpiod::line unsetLine_;
     std::atomic<bool> currentState_{true};
+    std::thread workerThread_;
+    std::mutex queueMutex_;
+    std::condition_variable queueCv_;
+    std::queue<bool> commands_;
+    bool running_{false};
+    // Whether the relay has been pulsed at least once; until then the
+    // physical state is unknown and commands are always applied
+    bool statePulsed_{false};
 };
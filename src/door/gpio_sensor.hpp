@@ -7,12 +7,16 @@ class GpioSensor : public IDoorComponent, public IEventEmitter
 public:
     GpioSensor(const std::string& doorId,
         unsigned int pin,
-        bool activeHigh, 
-        const std::string& sensorType)
+        bool activeHigh,
+        const std::string& sensorType,
+        std::shared_ptr<gpiod::chip> chip)
     : doorId_(doorId)
     , pin_(pin)
     , activeHigh_(activeHigh)
     , sensorType_(sensorType)
+    , topic_("door/" + doorId + "/" + sensorType)
+    , eventType_(sensorType + "_change")
+    , chip_(std::move(chip))
     {
     }
 
@@ -20,7 +24,6 @@ public:
     {
         try
         {
-            chip_ = std::make_unique<gpiod::chip>("/dev/gpiochip0");
             line_ = chip_->get_line(pin_);
             line_.request({"door_sensor", gpiod::line_request::EVENT_BOTH_EDGES, gpiod::line_request::FLAG_BIAS_PULL_UP});
             
@@ -62,19 +65,31 @@ private:
             if (ev)
             {
                 auto event = line_.event_read();
-                bool newState = (line_.get_value() == 1) == activeHigh_;
+                // The edge type already tells us the new level; skip the
+                // extra get_value() round trip into the kernel
+                bool newState = (event.event_type == gpiod::line_event::RISING_EDGE) == activeHigh_;
                 
                 if (newState != currentState_)
                 {
                     currentState_ = newState;
                     if (eventCallback)
                     {
-                        nlohmann::json event;
-                        event["type"] = sensorType_ + "_change";
-                        event["door_id"] = doorId_;
-                        event["state"] = currentState_.load();  // Get value from atomic
-                        event["timestamp"] = std::chrono::system_clock::to_time_t(std::chrono::system_clock::now());
-                        eventCallback("door/" + doorId_ + "/" + sensorType_, event.dump());
+                        // The kernel stamps the edge against CLOCK_MONOTONIC
+                        // on modern kernels; translate it into wall clock so
+                        // the payload keeps publishing Unix epoch seconds
+                        auto edgeWallTime = std::chrono::system_clock::now()
+                            - (std::chrono::steady_clock::now().time_since_epoch() - event.timestamp);
+
+                        // Build the payload in one pass instead of four
+                        // separate key insertions
+                        nlohmann::json payload = nlohmann::json
+                        {
+                            {"type", eventType_},
+                            {"door_id", doorId_},
+                            {"state", newState},
+                            {"timestamp", std::chrono::system_clock::to_time_t(edgeWallTime)}
+                        };
+                        eventCallback(topic_, payload.dump());
                     }
                 }
             }
@@ -85,7 +100,9 @@ private:
     unsigned int pin_;
     bool activeHigh_;
     std::string sensorType_;
-    std::unique_ptr<gpiod::chip> chip_;
+    std::string topic_;
+    std::string eventType_;
+    std::shared_ptr<gpiod::chip> chip_;
     gpiod::line line_;
     std::atomic<bool> running_{false};
     std::atomic<bool> currentState_{false};
@@ -7,19 +7,21 @@
 #include <spdlog/spdlog.h>
 #include <nlohmann/json.hpp>
 #include <algorithm>
-#include <numeric>
-#include <sstream>
-#include <iomanip>
+#include <spdlog/fmt/fmt.h>
+#include <pthread.h>
 
 class WiegandReader : public IDoorComponent, public IEventEmitter
 {
 public:
     WiegandReader(const std::string& doorId,
         unsigned int data0Pin,
-        unsigned int data1Pin)
+        unsigned int data1Pin,
+        std::shared_ptr<gpiod::chip> chip)
     : doorId_(doorId)
     , data0Pin_(data0Pin)
     , data1Pin_(data1Pin)
+    , cardTopic_("access/" + doorId)
+    , chip_(std::move(chip))
     {
     }
 
@@ -27,7 +29,6 @@ public:
     {
         try
         {
-            chip_ = std::make_unique<gpiod::chip>("/dev/gpiochip0");
             d0_ = chip_->get_line(data0Pin_);
             d1_ = chip_->get_line(data1Pin_);
 
@@ -46,6 +47,17 @@ public:
 
             running_ = true;
             readerThread_ = std::thread(&WiegandReader::readerLoop, this);
+
+            // Best-effort real-time priority so edge capture isn't
+            // preempted by ordinary system load; needs root (we run
+            // under sudo for GPIO access anyway)
+            sched_param sch{};
+            sch.sched_priority = 10;
+            if (pthread_setschedparam(readerThread_.native_handle(), SCHED_FIFO, &sch) != 0)
+            {
+                spdlog::warn("Could not set real-time priority for reader thread; continuing at default priority");
+            }
+
             spdlog::info("Reader thread started successfully");
             return true;
         }
@@ -70,102 +82,132 @@ public:
         eventCallback = std::move(callback);
     }
 
+    // Typed handler for decoded card reads; invoked directly so the
+    // access decision doesn't pay a JSON serialize/parse round trip
+    void registerCardHandler(std::function<void(const CardRead&)> handler)
+    {
+        cardHandler_ = std::move(handler);
+    }
+
 private:
     void readerLoop()
     {
-        std::vector<int> bits;
+        // Bits are packed MSB-first into an integer accumulator; no
+        // per-bit heap traffic
+        uint64_t acc = 0;
+        size_t nbits = 0;
+        // Edges beyond the accumulator width (switch bounce, noise) are
+        // counted instead of collected, bounding work per storm
+        size_t droppedBits = 0;
+        const size_t maxFrameBits = 64;
         auto lastEvent = std::chrono::steady_clock::now();
         const auto timeout = std::chrono::milliseconds(50);  // Standard Wiegand timing
         bool collecting = false;
 
         spdlog::info("Reader started on D0={} D1={}", data0Pin_, data1Pin_);
         
+        // One wait covers both data lines; a single wakeup drains every
+        // queued edge instead of paying two waits plus a sleep per bit
+        gpiod::line_bulk lines;
+        lines.append(d0_);
+        lines.append(d1_);
+
+        // How long to block when no frame is in flight; bounded so the
+        // running_ flag is still checked regularly
+        const auto idleWait = std::chrono::milliseconds(100);
+
         while (running_.load())
         {
-            auto now = std::chrono::steady_clock::now();
-            
-            // Wait for events on both lines
-            auto ev_d0 = d0_.event_wait(std::chrono::microseconds(100));
-            auto ev_d1 = d1_.event_wait(std::chrono::microseconds(100));
-            
-            if (ev_d0)
+            // While collecting, sleep exactly until the frame deadline
+            // instead of polling on a fixed short timeout
+            auto waitFor = idleWait;
+            if (collecting)
             {
-                auto event = d0_.event_read();
-                if (event.event_type == gpiod::line_event::FALLING_EDGE)
-                {
-                    if (!collecting)
-                    {
-                        bits.clear();
-                        collecting = true;
-                    }
-                    bits.push_back(0);
-                    lastEvent = now;
-                }
+                auto deadline = lastEvent + timeout;
+                auto remaining = deadline - std::chrono::steady_clock::now();
+                waitFor = std::max(std::chrono::duration_cast<std::chrono::milliseconds>(remaining),
+                                   std::chrono::milliseconds(1));
             }
-            
-            if (ev_d1)
+
+            auto eventLines = lines.event_wait(waitFor);
+            if (!eventLines && !collecting)
             {
-                auto event = d1_.event_read();
-                if (event.event_type == gpiod::line_event::FALLING_EDGE)
+                // Idle wakeup with no frame in flight; skip the clock read
+                continue;
+            }
+            auto now = std::chrono::steady_clock::now();
+
+            if (eventLines)
+            {
+                for (auto& line : eventLines)
                 {
-                    if (!collecting)
+                    int bit = (line.offset() == data1Pin_) ? 1 : 0;
+                    for (const auto& event : line.event_read_multiple())
                     {
-                        bits.clear();
-                        collecting = true;
+                        if (event.event_type != gpiod::line_event::FALLING_EDGE)
+                        {
+                            continue;
+                        }
+                        if (!collecting)
+                        {
+                            acc = 0;
+                            nbits = 0;
+                            droppedBits = 0;
+                            collecting = true;
+                        }
+                        if (nbits < maxFrameBits)
+                        {
+                            acc = (acc << 1) | static_cast<uint64_t>(bit);
+                            ++nbits;
+                        }
+                        else
+                        {
+                            ++droppedBits;
+                        }
+                        lastEvent = now;
                     }
-                    bits.push_back(1);
-                    lastEvent = now;
                 }
             }
 
             // Process collected bits after timeout
             if (collecting && now - lastEvent > timeout)
             {
-                if (bits.size() == 32)
+                if (droppedBits > 0)
+                {
+                    spdlog::warn("Discarding noisy Wiegand frame on door {}: {} edges ({} beyond frame limit)",
+                                 doorId_, nbits + droppedBits, droppedBits);
+                }
+                else if (nbits == 32)
                 {
-                    processCard(bits);
+                    processCard(static_cast<uint32_t>(acc));
                 }
-                bits.clear();
+                acc = 0;
+                nbits = 0;
+                droppedBits = 0;
                 collecting = false;
             }
-            
-            // Prevent busy waiting
-            std::this_thread::sleep_for(std::chrono::microseconds(100));
         }
     }
 
-    void processCard(const std::vector<int>& bits)
+    void processCard(uint32_t fullValue)
     {
-        // Calculate parity bits and validate
-        bool evenParity = bits[0];
-        bool oddParity = bits[31];
-        int evenCount = std::count_if(bits.begin(), bits.begin() + 16, [](int b) { return b == 1; });
-        int oddCount = std::count_if(bits.begin() + 16, bits.end(), [](int b) { return b == 1; });
+        // Frame bits arrive MSB-first, so card bit i is value bit (31 - i)
+
+        // Calculate parity bits and validate; popcount per half-frame is
+        // a single instruction on the Pi's ARMv8 core
+        int evenCount = __builtin_popcount(fullValue >> 16);
+        int oddCount = __builtin_popcount(fullValue & 0xFFFFu);
         bool parityValid = (evenCount % 2 == 0) && (oddCount % 2 == 1);
 
         // Extract card data
-        uint16_t facilityCode = 0;
-        for (int i = 1; i < 9; i++)
-        {
-            facilityCode = (facilityCode << 1) | bits[i];
-        }
-
-        uint32_t cardNumber = 0;
-        for (int i = 9; i < 25; i++)
-        {
-            cardNumber = (cardNumber << 1) | bits[i];
-        }
-
-        uint32_t fullValue = std::accumulate(bits.begin(), bits.end(), 0u, 
-            [](uint32_t acc, int bit) { return (acc << 1) | bit; });
+        uint16_t facilityCode = (fullValue >> 23) & 0xFF;
+        uint32_t cardNumber = (fullValue >> 7) & 0xFFFF;
 
         // Convert bits to string for logging
-        std::string bitStr;
-        for (int b : bits) bitStr += std::to_string(b);
+        std::string bitStr = fmt::format("{:032b}", fullValue);
 
         // Format hex value
-        std::stringstream hexValue;
-        hexValue << "0x" << std::hex << std::setfill('0') << std::setw(8) << fullValue;
+        std::string hexValue = fmt::format("0x{:08x}", fullValue);
 
         // Log all card details in one structured message
         spdlog::info("\nReceived bits: {} (Length: {})\n"
@@ -175,14 +217,20 @@ private:
                     "  Facility Code: {}\n"
                     "  Card Number: {}\n"
                     "  Parity: {} (Even:{} Odd:{})\n",
-                    bitStr, bits.size(),
-                    hexValue.str(),
+                    bitStr, bitStr.size(),
+                    hexValue,
                     fullValue,
                     facilityCode,
                     cardNumber,
                     parityValid ? "Valid" : "Invalid", 
                     evenCount % 2 == 0, oddCount % 2 == 1);
 
+        // Dispatch decoded card to the access-decision handler
+        if (cardHandler_)
+        {
+            cardHandler_(CardRead{hexValue, facilityCode, cardNumber, parityValid});
+        }
+
         // Emit MQTT event
         if (eventCallback)
         {
@@ -191,7 +239,7 @@ private:
                 {"event", "access_attempt"},
                 {"door_id", doorId_},
                 {"card", nlohmann::json{
-                    {"raw", hexValue.str()},
+                    {"raw", hexValue},
                     {"facility_code", facilityCode},
                     {"number", cardNumber}
                 }},
@@ -201,15 +249,17 @@ private:
                 }},
                 {"timestamp", std::chrono::system_clock::to_time_t(std::chrono::system_clock::now())}
             };
-            eventCallback("access/" + doorId_, event.dump());
+            eventCallback(cardTopic_, event.dump());
         }
     }
 
     std::string doorId_;
     unsigned int data0Pin_, data1Pin_;
-    std::unique_ptr<gpiod::chip> chip_;
+    std::string cardTopic_;
+    std::shared_ptr<gpiod::chip> chip_;
     gpiod::line d0_, d1_;
     std::atomic<bool> running_{false};
     std::thread readerThread_;
     std::function<void(const std::string&, const std::string&)> eventCallback;
+    std::function<void(const CardRead&)> cardHandler_;
 };
@@ -63,13 +63,27 @@ int main(int argc, char** argv)
             doors.push_back(std::move(door));
         }
 
+        // Hand the MQTT network loop to mosquitto's own thread; the main
+        // thread only waits for a shutdown signal
+        if (!mqtt->loopStart())
+        {
+            logger->error("Failed to start MQTT network loop");
+            // The doors are already initialized; cleanup() joins their
+            // worker threads (and applies the final lock command) so we
+            // don't destruct joinable threads on the way out
+            for (auto& door : doors)
+            {
+                door->cleanup();
+            }
+            return 1;
+        }
+
         logger->info("All doors initialized. Running main loop...");
 
         // Main loop
         while (running.load())
         {
-            mqtt->loop();
-            std::this_thread::sleep_for(std::chrono::milliseconds(10));
+            std::this_thread::sleep_for(std::chrono::milliseconds(100));
         }
 
         // Cleanup
@@ -78,6 +92,7 @@ int main(int argc, char** argv)
         {
             door->cleanup();
         }
+        mqtt->loopStop();
 
     }
     catch (const std::exception& e)
@@ -4,6 +4,8 @@
 #include <nlohmann/json.hpp>
 #include <functional>
 #include <memory>
+#include <mutex>
+#include <unordered_map>
 #include <spdlog/spdlog.h>
 
 class MqttClient
@@ -52,14 +54,29 @@ public:
         return mosquitto_subscribe(mosq_, nullptr, topic.c_str(), 0) == MOSQ_ERR_SUCCESS;
     }
 
-    void setMessageHandler(std::function<void(const std::string&, const std::string&)> handler)
+    // Subscribe with a handler bound to this topic; inbound messages are
+    // routed straight to their subscriber instead of through one global
+    // handler shared by every door
+    bool subscribe(const std::string& topic,
+                   std::function<void(const std::string&, const std::string&)> handler)
     {
-        messageHandler_ = std::move(handler);
+        {
+            std::lock_guard<std::mutex> guard(handlersMutex_);
+            handlers_[topic] = std::move(handler);
+        }
+        return subscribe(topic);
     }
 
-    void loop()
+    // Run the network loop on mosquitto's own thread instead of
+    // polling mosquitto_loop from the caller
+    bool loopStart()
     {
-        mosquitto_loop(mosq_, 0, 1);
+        return mosquitto_loop_start(mosq_) == MOSQ_ERR_SUCCESS;
+    }
+
+    void loopStop()
+    {
+        mosquitto_loop_stop(mosq_, true);
     }
 
 private:
@@ -78,17 +95,28 @@ private:
     static void onMessage(struct mosquitto* mosq, void* obj, const struct mosquitto_message* msg)
     {
         auto* client = static_cast<MqttClient*>(obj);
-        if (client->messageHandler_)
+        std::string topic(msg->topic);
+
+        std::function<void(const std::string&, const std::string&)> handler;
         {
-            std::string topic(msg->topic);
-            std::string payload(static_cast<char*>(msg->payload), msg->payloadlen);
-            client->messageHandler_(topic, payload);
+            std::lock_guard<std::mutex> guard(client->handlersMutex_);
+            auto it = client->handlers_.find(topic);
+            if (it == client->handlers_.end())
+            {
+                return;
+            }
+            // Copy so the handler runs outside the lock
+            handler = it->second;
         }
+
+        std::string payload(static_cast<char*>(msg->payload), msg->payloadlen);
+        handler(topic, payload);
     }
 
     std::string clientId_;
     std::string host_;
     int port_;
     struct mosquitto* mosq_;
-    std::function<void(const std::string&, const std::string&)> messageHandler_;
+    std::mutex handlersMutex_;
+    std::unordered_map<std::string, std::function<void(const std::string&, const std::string&)>> handlers_;
 };
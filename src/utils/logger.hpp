@@ -1,5 +1,6 @@
 #pragma once
 #include <spdlog/spdlog.h>
+#include <spdlog/async.h>
 #include <spdlog/sinks/rotating_file_sink.h>
 #include <spdlog/sinks/stdout_color_sinks.h>
 #include <memory>
@@ -9,7 +10,14 @@ class Logger
 public:
     static void initialize(const std::string& doorId)
     {
-        auto doorLogger = spdlog::rotating_logger_mt(
+        // Shared background thread drains the log queue so file IO never
+        // blocks the GPIO/event threads; create the pool once
+        if (!spdlog::thread_pool())
+        {
+            spdlog::init_thread_pool(8192, 1);
+        }
+
+        auto doorLogger = spdlog::rotating_logger_mt<spdlog::async_factory>(
             "door_" + doorId,
             "logs/door_" + doorId + ".log",
             1024 * 1024 * 5,  // 5MB max file size